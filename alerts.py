@@ -0,0 +1,290 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from bond_data import COLUMNS
+from ratings import RATING_SCALE, normalize_ratings
+
+logger = logging.getLogger(__name__)
+
+# SQLite file holding watchlist rules and the alert outbox
+ALERTS_PATH_ENV = "BONDS_ALERTS_PATH"
+DEFAULT_ALERTS_PATH = "bond_alerts.sqlite3"
+
+SCREEN = "screen"
+MOVE = "move"
+
+RULE_COLUMNS = ["Rule", "Name", "Kind", "Definition", "Created"]
+ALERT_COLUMNS = ["Time", "Rule", "ISIN", "Issuer Name", "Message", "Dataset Version"]
+
+
+def _rating_at_least(values, rating):
+    # Ordered categorical, best first; "NR" sorts after every real rating
+    return normalize_ratings(values).codes <= RATING_SCALE.index(rating)
+
+
+OPERATORS = {
+    ">": lambda values, value: values.to_numpy() > value,
+    ">=": lambda values, value: values.to_numpy() >= value,
+    "<": lambda values, value: values.to_numpy() < value,
+    "<=": lambda values, value: values.to_numpy() <= value,
+    "==": lambda values, value: values.to_numpy() == value,
+    "!=": lambda values, value: values.to_numpy() != value,
+    "in": lambda values, value: values.isin(value).to_numpy(),
+    "contains": lambda values, value: values.astype(str).str.contains(value, case=False, regex=False).to_numpy(),
+    "rating_at_least": _rating_at_least,
+}
+
+# Derived on load from the current date, so they move without the source changing
+TIME_FIELDS = ["Days to Maturity", "Years to Maturity", "Total Value"]
+
+# Columns a rule may test: the raw bond columns plus those derived on load
+RULE_FIELDS = COLUMNS + TIME_FIELDS + ["Bond Type"]
+
+
+def alerts_path():
+    return os.environ.get(ALERTS_PATH_ENV, DEFAULT_ALERTS_PATH)
+
+
+def validate_conditions(conditions):
+    """Check screen conditions of the form ``{"column", "op", "value"}``; raises ValueError."""
+    if not conditions:
+        raise ValueError("a screen needs at least one condition")
+    for condition in conditions:
+        if condition["column"] not in RULE_FIELDS:
+            raise ValueError(f"unknown column {condition['column']!r}")
+        if condition["op"] not in OPERATORS:
+            raise ValueError(f"unknown operator {condition['op']!r}")
+        if condition["op"] == "rating_at_least" and condition["value"] not in RATING_SCALE:
+            raise ValueError(f"unknown rating {condition['value']!r}")
+
+
+def compile_screen(conditions):
+    """Turn screen conditions into ``mask(df, cache)`` returning a boolean array.
+
+    ``cache`` is shared by all screens in one evaluation, so a condition
+    common to many users' screens is computed once.
+    """
+    keys = [
+        (condition["column"], condition["op"], json.dumps(condition["value"]))
+        for condition in conditions
+    ]
+
+    def mask(df, cache):
+        result = np.ones(len(df), dtype=bool)
+        for key, condition in zip(keys, conditions):
+            if key not in cache:
+                cache[key] = OPERATORS[condition["op"]](df[condition["column"]], condition["value"])
+            result &= cache[key]
+        return result
+
+    return mask
+
+
+def describe_rule(kind, spec):
+    if kind == MOVE:
+        return f"{spec['isin']} {spec['column']} moves {spec['threshold_bp']:g} bp"
+    return " and ".join(
+        f"{condition['column']} {condition['op']} {condition['value']}" for condition in spec["conditions"]
+    )
+
+
+def uses_time_fields(kind, spec):
+    return kind == SCREEN and any(condition["column"] in TIME_FIELDS for condition in spec["conditions"])
+
+
+def changed_rows(previous_df, df, columns=COLUMNS):
+    """Rows of ``df`` that are new or differ from ``previous_df`` in ``columns``.
+
+    Returns ``(current, before, existed)``: the changed rows, the previous
+    row of each bond matched by ISIN, and whether it existed before. New
+    bonds get their current row as ``before``.
+    """
+    df = df.drop_duplicates(subset="ISIN", keep="last").reset_index(drop=True)
+    previous_df = previous_df.drop_duplicates(subset="ISIN", keep="last").reset_index(drop=True)
+    old_hashes = pd.util.hash_pandas_object(previous_df[columns], index=False).to_numpy()
+    new_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+    old_positions = pd.Index(previous_df["ISIN"]).get_indexer(df["ISIN"])
+    existed = old_positions >= 0
+    changed = ~existed | (old_hashes[old_positions] != new_hashes)
+
+    current = df[changed].reset_index(drop=True)
+    old_positions = old_positions[changed]
+    existed = existed[changed]
+    source = pd.concat([previous_df, current], ignore_index=True)
+    before_positions = np.where(existed, old_positions, len(previous_df) + np.arange(len(current)))
+    before = source.iloc[before_positions].reset_index(drop=True)
+    return current, before, existed
+
+
+class AlertEngine:
+    """Watchlist rules evaluated incrementally against each new bond book.
+
+    Two kinds of rule are stored in SQLite next to an alert outbox:
+
+    - screen: conditions over bond columns, such as a minimum rating,
+      yield and maximum years to maturity. It fires when a bond starts to
+      match, because it is new or because its row changed.
+    - move: a column of one ISIN, by default Offer Yield. It fires when the
+      value has moved ``threshold_bp`` from the reference, which then
+      resets to the new value.
+
+    ``evaluate`` only looks at rows whose source columns changed between two
+    books, so hundreds of screens cost a handful of vectorized masks over
+    the changed rows. Screens on ``TIME_FIELDS`` are also checked against
+    the rows whose maturity moved since the previous book, so a bond that
+    shortens into "under 3 years" is caught. The first book after a restart
+    is a baseline only.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or alerts_path()
+        self._lock = threading.Lock()
+        with self._connect() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS rules (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    spec TEXT NOT NULL,
+                    state TEXT NOT NULL DEFAULT '{}',
+                    created TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id INTEGER PRIMARY KEY,
+                    rule_id INTEGER NOT NULL,
+                    isin TEXT NOT NULL,
+                    issuer TEXT,
+                    message TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    created TEXT NOT NULL,
+                    UNIQUE (rule_id, isin, version)
+                );
+            """)
+
+    @contextmanager
+    def _connect(self):
+        # Short-lived connections, so sessions and the warmer thread can share the file
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                yield connection
+
+    def add_screen(self, name, conditions):
+        validate_conditions(conditions)
+        return self._add_rule(name, SCREEN, {"conditions": conditions}, {})
+
+    def add_move(self, name, isin, reference, threshold_bp, column="Offer Yield"):
+        """Watch ``column`` of ``isin`` for a move of ``threshold_bp`` from ``reference``."""
+        if column not in RULE_FIELDS:
+            raise ValueError(f"unknown column {column!r}")
+        if threshold_bp <= 0:
+            raise ValueError("threshold_bp must be positive")
+        spec = {"isin": isin, "column": column, "threshold_bp": threshold_bp}
+        return self._add_rule(name, MOVE, spec, {"reference": float(reference)})
+
+    def _add_rule(self, name, kind, spec, state):
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO rules (name, kind, spec, state, created) VALUES (?, ?, ?, ?, ?)",
+                (name, kind, json.dumps(spec), json.dumps(state), datetime.now().isoformat(timespec="seconds")),
+            )
+            return cursor.lastrowid
+
+    def remove_rule(self, rule_id):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM rules WHERE id = ?", (rule_id,))
+
+    def rules(self):
+        with self._connect() as connection:
+            rows = connection.execute("SELECT id, name, kind, spec, created FROM rules ORDER BY id").fetchall()
+        return pd.DataFrame(
+            [(rule_id, name, kind, describe_rule(kind, json.loads(spec)), created)
+             for rule_id, name, kind, spec, created in rows],
+            columns=RULE_COLUMNS,
+        )
+
+    def alerts(self, limit=100):
+        """Most recent alerts first."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT alerts.created, COALESCE(rules.name, '#' || alerts.rule_id), alerts.isin, "
+                "alerts.issuer, alerts.message, alerts.version FROM alerts "
+                "LEFT JOIN rules ON rules.id = alerts.rule_id ORDER BY alerts.id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return pd.DataFrame(rows, columns=ALERT_COLUMNS)
+
+    def evaluate(self, previous, book):
+        """Evaluate every rule against the rows that changed from ``previous`` to ``book``.
+
+        Matches are written to the outbox; returns the number of new alerts.
+        """
+        with self._lock:
+            current, before, existed = changed_rows(previous.df, book.df)
+            with self._connect() as connection:
+                rules = connection.execute("SELECT id, kind, spec, state FROM rules").fetchall()
+                alerts, states = self._matches(rules, current, before, existed)
+                # Screens on maturity also see bonds whose source rows did not change;
+                # a bond caught by both passes is stored once per version
+                timed_rules = [rule for rule in rules if uses_time_fields(rule[1], json.loads(rule[2]))]
+                if timed_rules:
+                    timed_alerts, _ = self._matches(
+                        timed_rules, *changed_rows(previous.df, book.df, TIME_FIELDS)
+                    )
+                    alerts += timed_alerts
+                created = datetime.now().isoformat(timespec="seconds")
+                inserted = connection.executemany(
+                    "INSERT OR IGNORE INTO alerts (rule_id, isin, issuer, message, version, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(rule_id, isin, issuer, message, book.version, created)
+                     for rule_id, isin, issuer, message in alerts],
+                ).rowcount
+                connection.executemany(
+                    "UPDATE rules SET state = ? WHERE id = ?",
+                    [(json.dumps(state), rule_id) for rule_id, state in states],
+                )
+        logger.info(
+            "Evaluated %d rules on %d changed bonds for version %s: %d alerts",
+            len(rules), len(current), book.version, inserted,
+        )
+        return inserted
+
+    def _matches(self, rules, current, before, existed):
+        alerts = []
+        states = []
+        current_cache = {}
+        before_cache = {}
+        isins = current["ISIN"].to_numpy()
+        issuers = current["Issuer Name"].to_numpy()
+        positions = pd.Series(np.arange(len(current)), index=isins)
+
+        for rule_id, kind, spec, state in rules:
+            spec = json.loads(spec)
+            if kind == SCREEN:
+                mask = compile_screen(spec["conditions"])
+                fired = mask(current, current_cache) & ~(existed & mask(before, before_cache))
+                message = f"Now matches: {describe_rule(kind, spec)}"
+                for position in np.flatnonzero(fired):
+                    alerts.append((rule_id, isins[position], issuers[position], message))
+            elif kind == MOVE and spec["isin"] in positions.index:
+                position = positions[spec["isin"]]
+                reference = json.loads(state).get("reference")
+                value = float(current[spec["column"]].iloc[position])
+                if reference is None or np.isnan(value):
+                    continue
+                move_bp = (value - reference) * 10_000
+                if abs(move_bp) >= spec["threshold_bp"]:
+                    alerts.append((
+                        rule_id, spec["isin"], issuers[position],
+                        f"{spec['column']} moved {move_bp:+.0f} bp from {reference:.2%} to {value:.2%}",
+                    ))
+                    states.append((rule_id, {"reference": value}))
+        return alerts, states
@@ -0,0 +1,118 @@
+import threading
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from bond_data import dataset_version, load_bonds
+from daycount import ACCRUAL_COLUMNS, accrued_interest
+from relative_value import RV_COLUMNS, peer_relative_value
+from search_index import SearchIndex
+
+MARKET_CONVENTION = "Market Convention"
+
+
+def filter_signature(filters):
+    """Hashable key identifying a filter combination."""
+    return repr(sorted(filters.items()))
+
+
+class BondBook:
+    """One dataset version of the bond inventory and everything derived from it.
+
+    The search index is built once; tax-adjusted yields and relative value
+    are cached per tax bracket, and accruals per settlement date.
+    A book is immutable once built, so it can be shared between sessions
+    and threads.
+    """
+
+    def __init__(self, df, version=None):
+        self.df = df
+        self.version = version or dataset_version(df)
+        self._lock = threading.Lock()
+        self._search_index = None
+        self.taxable_equivalent_yield = lru_cache(maxsize=16)(self._taxable_equivalent_yield)
+        self.relative_value = lru_cache(maxsize=16)(self._relative_value)
+        self.accruals = lru_cache(maxsize=32)(self._accruals)
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def search_index(self):
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SearchIndex(self.df)
+            return self._search_index
+
+    def _taxable_equivalent_yield(self, tax_bracket):
+        # Pre-tax equivalent yield for tax-free issues
+        tax_free = self.df['Special Feature'].eq("Tax Free").to_numpy()
+        offer_yield = self.df['Offer Yield'].to_numpy(dtype=float)
+        return np.where(tax_free, offer_yield / (1 - tax_bracket / 100), offer_yield)
+
+    def _relative_value(self, tax_bracket):
+        # Spread, z-score and percentile vs rating-bucket / maturity-band peers,
+        # on pre-tax equivalent yields so tax-free issues are not flagged rich
+        return peer_relative_value(self.df, self.taxable_equivalent_yield(tax_bracket))
+
+    def _accruals(self, as_of, day_count):
+        # Accrued interest and yield-implied prices for a settlement date
+        return accrued_interest(self.df, as_of, None if day_count == MARKET_CONVENTION else day_count)
+
+    def warm(self):
+        """Build the per-version artefacts up front."""
+        self.search_index
+        self.relative_value(self.default_filters()['tax_bracket'])
+
+    def default_filters(self):
+        """Sidebar filter values on first load."""
+        df = self.df
+        return {
+            'search_query': "",
+            'bond_type': "All",
+            'holding_time': 3.0,
+            'credit_ratings': tuple(sorted(df['Credit Rating'].unique())),
+            'coupon_range': (5.0, 12.0),
+            'tax_bracket': 30.0,
+            'min_yield': 0.0,
+            'security_types': tuple(df['Secured / Unsecured'].unique()),
+            'payment_frequencies': tuple(df['Interest Payment Frequency'].unique()),
+            'as_of': date.today(),
+            'day_count': MARKET_CONVENTION,
+        }
+
+    def query(self, filters):
+        """Bonds matching ``filters``, with derived columns, in search-relevance order."""
+        df = self.df
+        mask = np.ones(len(df), dtype=bool)
+
+        if filters['bond_type'] != "All":
+            mask &= (df['Bond Type'] == filters['bond_type']).to_numpy()
+
+        min_coupon, max_coupon = filters['coupon_range']
+        coupon = df['Coupon'].to_numpy(dtype=float) * 100
+        pre_tax_yield = self.taxable_equivalent_yield(filters['tax_bracket'])
+        mask &= (df['Years to Maturity'] <= filters['holding_time']).to_numpy()
+        mask &= df['Credit Rating'].isin(filters['credit_ratings']).to_numpy()
+        mask &= (coupon >= min_coupon) & (coupon <= max_coupon)
+        mask &= pre_tax_yield * 100 >= filters['min_yield']
+        mask &= df['Secured / Unsecured'].isin(filters['security_types']).to_numpy()
+        mask &= df['Interest Payment Frequency'].isin(filters['payment_frequencies']).to_numpy()
+
+        # Intersect with search hits, keeping relevance order
+        if filters['search_query'].strip():
+            rows = self.search_index.search(filters['search_query'])
+            rows = rows[mask[rows]]
+        else:
+            rows = np.flatnonzero(mask)
+
+        filtered_df = df.iloc[rows].copy()
+        filtered_df['Pre-Tax Equiv. Yield'] = pre_tax_yield[rows]
+        filtered_df[RV_COLUMNS] = self.relative_value(filters['tax_bracket']).iloc[rows]
+        filtered_df[ACCRUAL_COLUMNS] = self.accruals(filters['as_of'], filters['day_count']).iloc[rows]
+        return filtered_df
+
+
+def load_book():
+    return BondBook(load_bonds())
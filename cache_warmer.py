@@ -0,0 +1,126 @@
+import logging
+import heapq
+import threading
+from collections import OrderedDict
+
+from bond_book import filter_signature
+
+logger = logging.getLogger(__name__)
+
+# How often the data source is checked for a new version, in seconds
+POLL_INTERVAL = 60.0
+
+# Number of most-used filter combinations warmed besides the defaults
+TOP_FILTER_SETS = 5
+
+# Filter combinations tracked; the least recently used is dropped beyond this
+MAX_TRACKED_FILTER_SETS = 256
+
+
+class CacheWarmer:
+    """Loads new dataset versions in a background thread and warms caches
+    before publishing them.
+
+    ``load_fn`` returns a ``BondBook``, ``source_fn`` returns a cheap marker
+    that changes when the source data does, and ``warm_fn(book, filter_sets)``
+    precomputes whatever the dashboard caches. Sessions keep reading the
+    previously published book until warming has finished. Functions passed
+    to ``subscribe`` are called with ``(previous, book)`` after each later
+    publish.
+    """
+
+    def __init__(self, load_fn, source_fn, warm_fn, poll_interval=POLL_INTERVAL):
+        self.load_fn = load_fn
+        self.source_fn = source_fn
+        self.warm_fn = warm_fn
+        self.poll_interval = poll_interval
+        self._published = None
+        self._source = None
+        self._filter_counts = OrderedDict()  # key -> [count, filters], least recently used first
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        # The very first version is published cold so the page can render;
+        # its caches are warmed in the background right after
+        self._source = self.source_fn()
+        self._publish(self.load_fn())
+        self._thread = threading.Thread(target=self._run, name="bond-cache-warmer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def published(self):
+        """Return the ``BondBook`` sessions should render."""
+        return self._published
+
+    def subscribe(self, fn):
+        """Call ``fn(previous, book)`` whenever a new book replaces ``previous``."""
+        self._subscribers.append(fn)
+
+    def record_filters(self, filters):
+        """Count a filter combination used by a session.
+
+        Searches are not counted, since every keystroke is a new combination.
+        The settlement date is left out; sets are warmed for the current one.
+        """
+        if filters['search_query'].strip():
+            return
+        filters = {key: value for key, value in filters.items() if key != 'as_of'}
+        filter_key = filter_signature(filters)
+        with self._lock:
+            entry = self._filter_counts.pop(filter_key, None) or [0, filters]
+            entry[0] += 1
+            self._filter_counts[filter_key] = entry
+            if len(self._filter_counts) > MAX_TRACKED_FILTER_SETS:
+                self._filter_counts.popitem(last=False)
+
+    def common_filter_sets(self, limit=TOP_FILTER_SETS):
+        with self._lock:
+            entries = heapq.nlargest(limit, self._filter_counts.values(), key=lambda entry: entry[0])
+        return [filters for _, filters in entries]
+
+    def refresh(self):
+        """Load, warm and publish the data source if it has changed."""
+        source = self.source_fn()
+        if source == self._source:
+            return False
+        book = self.load_fn()
+        previous = self._published
+        if book.version != previous.version:
+            self._warm(book)
+            self._publish(book)
+            self._notify(previous, book)
+        self._source = source
+        return True
+
+    def _publish(self, book):
+        # Single reference swap; readers see either the old or the new book
+        self._published = book
+        logger.info("Published bond dataset version %s (%d rows)", book.version, len(book))
+
+    def _warm(self, book):
+        as_of = book.default_filters()['as_of']
+        filter_sets = [{**filters, 'as_of': as_of} for filters in self.common_filter_sets()]
+        try:
+            self.warm_fn(book, filter_sets)
+        except Exception:
+            logger.exception("Cache warming failed for dataset version %s", book.version)
+
+    def _notify(self, previous, book):
+        for fn in self._subscribers:
+            try:
+                fn(previous, book)
+            except Exception:
+                logger.exception("Publish subscriber failed for dataset version %s", book.version)
+
+    def _run(self):
+        self._warm(self._published)
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Bond data refresh failed")
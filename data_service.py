@@ -0,0 +1,222 @@
+import argparse
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+from datetime import date
+
+import pyarrow as pa
+
+from alerts import AlertEngine
+from bond_book import load_book
+from bond_data import source_signature
+from cache_warmer import CacheWarmer
+
+logger = logging.getLogger(__name__)
+
+# Unix socket of a running data service; when set the dashboard becomes a thin client
+SOCKET_ENV = "BONDS_DATA_SERVICE"
+DEFAULT_SOCKET = "/tmp/bonds-data.sock"
+
+# How often each dashboard worker checks the service for a new version, in seconds
+CLIENT_POLL_INTERVAL = 5.0
+
+TUPLE_FILTERS = ("credit_ratings", "coupon_range", "security_types", "payment_frequencies")
+
+_LENGTH = struct.Struct("!Q")
+
+
+def data_service_path():
+    return os.environ.get(SOCKET_ENV) or None
+
+
+def _send_frame(sock, payload):
+    sock.sendall(_LENGTH.pack(len(payload)))
+    sock.sendall(payload)
+
+
+def _recv_exact(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            raise ConnectionError("Data service closed the connection")
+        received += count
+    return buffer
+
+
+def _recv_frame(sock):
+    (size,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    return _recv_exact(sock, size)
+
+
+def encode_filters(filters):
+    return {
+        key: value.isoformat() if isinstance(value, date) else list(value) if isinstance(value, tuple) else value
+        for key, value in filters.items()
+    }
+
+
+def decode_filters(payload):
+    filters = dict(payload)
+    for key in TUPLE_FILTERS:
+        filters[key] = tuple(filters[key])
+    filters["as_of"] = date.fromisoformat(filters["as_of"])
+    return filters
+
+
+def frame_to_arrow(df):
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def arrow_to_frame(payload):
+    return pa.ipc.open_stream(pa.py_buffer(payload)).read_all().to_pandas()
+
+
+class BondRequestHandler(socketserver.BaseRequestHandler):
+    # One JSON request frame per connection; the reply is a JSON header frame,
+    # followed by an Arrow IPC frame when the header says so
+    def handle(self):
+        body = None
+        try:
+            request = json.loads(_recv_frame(self.request))
+            book = self.server.warmer.published()
+            header = {"version": book.version}
+            op = request["op"]
+            if op == "version":
+                header["rows"] = len(book)
+            elif op == "default_filters":
+                header["filters"] = encode_filters(book.default_filters())
+            elif op == "query":
+                filters = decode_filters(request["filters"])
+                self.server.warmer.record_filters(filters)
+                filtered_df = book.query(filters)
+                header["rows"] = len(filtered_df)
+                body = frame_to_arrow(filtered_df)
+            else:
+                raise ValueError(f"Unknown operation {op!r}")
+        except Exception as exc:
+            logger.exception("Data service request failed")
+            header = {"error": str(exc)}
+        header["body"] = body is not None
+        _send_frame(self.request, json.dumps(header).encode("utf-8"))
+        if body is not None:
+            _send_frame(self.request, body)
+
+
+class BondDataService(socketserver.ThreadingUnixStreamServer):
+    """Serves filter queries over the published ``BondBook``."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, warmer):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.warmer = warmer
+        super().__init__(socket_path, BondRequestHandler)
+
+
+class DataServiceClient:
+    """Thin client for ``BondDataService``; safe to share between threads."""
+
+    def __init__(self, socket_path, timeout=30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _request(self, request):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            _send_frame(sock, json.dumps(request).encode("utf-8"))
+            header = json.loads(_recv_frame(sock))
+            body = _recv_frame(sock) if header.get("body") else None
+        if "error" in header:
+            raise RuntimeError(f"Data service error: {header['error']}")
+        return header, body
+
+    def version(self):
+        return self._request({"op": "version"})[0]["version"]
+
+    def book(self):
+        """A ``RemoteBook`` for the version the service is publishing now."""
+        header, _ = self._request({"op": "version"})
+        return RemoteBook(self, header["version"], header["rows"])
+
+    def default_filters(self):
+        header, _ = self._request({"op": "default_filters"})
+        return header["version"], decode_filters(header["filters"])
+
+    def query(self, filters):
+        header, body = self._request({"op": "query", "filters": encode_filters(filters)})
+        return header["version"], arrow_to_frame(body)
+
+
+
+class RemoteBook:
+    """``BondBook`` interface over the data service, pinned to one version.
+
+    Lets a dashboard worker run its own ``CacheWarmer`` and warm its figure
+    caches whenever the service publishes a new version. Queries fail once
+    the service has moved on, so stale data is never cached as this version.
+    """
+
+    def __init__(self, client, version, rows):
+        self.client = client
+        self.version = version
+        self.rows = rows
+
+    def __len__(self):
+        return self.rows
+
+    def warm(self):
+        # The service warms the book itself
+        pass
+
+    def default_filters(self):
+        return self._checked(self.client.default_filters())
+
+    def query(self, filters):
+        return self._checked(self.client.query(filters))
+
+    def _checked(self, response):
+        version, result = response
+        if version != self.version:
+            raise RuntimeError(f"Data service moved from version {self.version} to {version}")
+        return result
+
+
+def warm_book(book, filter_sets):
+    book.warm()
+    for filters in [book.default_filters()] + filter_sets:
+        book.query(filters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the bond book to dashboard workers over a Unix socket")
+    parser.add_argument("--socket", default=data_service_path() or DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--poll", type=float, default=None, help="seconds between data source checks")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    warmer = CacheWarmer(load_book, source_signature, warm_book)
+    if args.poll:
+        warmer.poll_interval = args.poll
+    # Watchlist rules are evaluated here, once, rather than in each dashboard server
+    warmer.subscribe(AlertEngine().evaluate)
+    warmer.start()
+
+    with BondDataService(args.socket, warmer) as server:
+        logger.info("Serving bond data on %s", args.socket)
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+ACT_365 = "ACT/365"
+ACT_ACT = "ACT/ACT"
+THIRTY_360 = "30/360"
+CONVENTIONS = [ACT_365, ACT_ACT, THIRTY_360]
+
+# Market default: government securities accrue 30/360, corporate NCDs ACT/ACT
+THIRTY_360_FEATURES = {"SDL", "G-Sec", "Strips"}
+
+# Coupons per year; 0 means no periodic coupon
+COUPON_FREQUENCY = {
+    "monthly": 12,
+    "quarterly": 4,
+    "semiannually": 2,
+    "annually": 1,
+    "onmaturity": 0,
+}
+
+ACCRUAL_COLUMNS = [
+    "Day Count", "Previous Coupon Date", "Next Coupon Date",
+    "Accrued Interest", "Dirty Price", "Clean Price", "Settlement Amount",
+]
+
+
+def coupon_frequency(payment_frequency):
+    key = payment_frequency.astype(str).str.lower().str.replace(r"[^a-z]", "", regex=True)
+    return key.map(COUPON_FREQUENCY).fillna(0).astype(int).to_numpy()
+
+
+def market_conventions(special_feature):
+    return np.where(special_feature.isin(THIRTY_360_FEATURES).to_numpy(), THIRTY_360, ACT_ACT)
+
+
+def _add_months(month_index, day):
+    # Date with the given absolute month index (year * 12 + month - 1) and
+    # day of month, clamped to the end of shorter months
+    months = month_index.astype("datetime64[M]")
+    month_days = ((months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")).astype(int)
+    return months.astype("datetime64[D]") + (np.minimum(day, month_days) - 1)
+
+
+def coupon_dates(redemption, frequency, as_of):
+    """Previous and next coupon dates around ``as_of``.
+
+    Coupons are assumed to fall on the redemption day of month, every
+    12 / ``frequency`` months back from redemption. Bonds without periodic
+    coupons or already redeemed get NaT.
+    """
+    redemption = np.asarray(redemption, dtype="datetime64[D]")
+    as_of = np.datetime64(as_of, "D")
+    periodic = (frequency > 0) & (redemption > as_of)
+    step = np.where(frequency > 0, 12 // np.maximum(frequency, 1), 12)
+
+    redemption_month = redemption.astype("datetime64[M]").astype(np.int64)
+    redemption_day = (redemption - redemption.astype("datetime64[M]").astype("datetime64[D]")).astype(int) + 1
+    as_of_month = as_of.astype("datetime64[M]").astype(np.int64)
+
+    # Smallest number of periods back from redemption landing on or before as_of
+    periods_back = np.maximum(-((as_of_month - redemption_month) // step), 0)
+    previous = _add_months(redemption_month - periods_back * step, redemption_day)
+    periods_back = np.where(previous > as_of, periods_back + 1, periods_back)
+    previous = _add_months(redemption_month - periods_back * step, redemption_day)
+    next_ = _add_months(redemption_month - (periods_back - 1) * step, redemption_day)
+
+    nat = np.datetime64("NaT", "D")
+    return np.where(periodic, previous, nat), np.where(periodic, next_, nat)
+
+
+def days_30_360(start, end):
+    """30/360 bond basis day count between two date arrays."""
+    start = pd.DatetimeIndex(start)
+    end = pd.DatetimeIndex(end)
+    d1 = np.minimum(start.day.to_numpy(), 30)
+    d2 = np.where((d1 == 30) & (end.day.to_numpy() == 31), 30, end.day.to_numpy())
+    return (
+        360 * (end.year.to_numpy() - start.year.to_numpy())
+        + 30 * (end.month.to_numpy() - start.month.to_numpy())
+        + (d2 - d1)
+    )
+
+
+def accrual_fraction(previous, next_, as_of, frequency, conventions):
+    """Fraction of a year's coupon accrued since ``previous`` under each convention."""
+    as_of = np.datetime64(as_of, "D")
+    elapsed = (as_of - previous).astype("timedelta64[D]").astype(float)
+    period = (next_ - previous).astype("timedelta64[D]").astype(float)
+    as_of_dates = np.full(len(previous), as_of)
+    fraction = np.select(
+        [conventions == ACT_365, conventions == ACT_ACT, conventions == THIRTY_360],
+        [
+            elapsed / 365,
+            elapsed / period / np.maximum(frequency, 1),
+            days_30_360(previous, as_of_dates) / 360,
+        ],
+        default=np.nan,
+    )
+    return np.where(np.isnat(previous), 0.0, fraction)
+
+
+def accrued_interest(df, as_of, convention=None):
+    """Accrued interest and yield-implied prices per bond as of ``as_of``.
+
+    ``convention`` forces one day count for every bond; by default
+    ``market_conventions`` is used. Prices are per unit of ``Face Value``,
+    computed by discounting the remaining coupons and redemption at
+    ``Offer Yield``. Partial principal redemptions are not modelled, and
+    bonds that pay all interest on maturity are priced only if they are
+    zero coupon.
+    """
+    frequency = coupon_frequency(df["Interest Payment Frequency"])
+    if convention is None:
+        conventions = market_conventions(df["Special Feature"])
+    else:
+        conventions = np.full(len(df), convention)
+
+    redemption = df["Redemption Date"].to_numpy().astype("datetime64[D]")
+    previous, next_ = coupon_dates(redemption, frequency, as_of)
+
+    face_value = df["Face Value"].to_numpy(dtype=float)
+    coupon = df["Coupon"].to_numpy(dtype=float)
+    offer_yield = df["Offer Yield"].to_numpy(dtype=float)
+    accrued = face_value * np.nan_to_num(coupon) * accrual_fraction(previous, next_, as_of, frequency, conventions)
+
+    as_of_day = np.datetime64(as_of, "D")
+    periodic = ~np.isnat(next_)
+    f = np.maximum(frequency, 1)
+    v = 1.0 / (1.0 + offer_yield / f)
+
+    # Periodic payers: remaining coupons form an annuity discounted from the next coupon date
+    to_next = (next_ - as_of_day).astype("timedelta64[D]").astype(float)
+    period = (next_ - previous).astype("timedelta64[D]").astype(float)
+    step = 12 // f
+    remaining = np.where(
+        periodic,
+        (redemption.astype("datetime64[M]").astype(np.int64)
+         - next_.astype("datetime64[M]").astype(np.int64)) // step + 1,
+        0,
+    )
+    annuity = np.where(np.isclose(v, 1.0), remaining, (1 - v ** remaining) / (1 - v))
+    periodic_dirty = v ** (to_next / period) * (
+        face_value * coupon / f * annuity + face_value * v ** (remaining - 1)
+    )
+
+    # Zero coupons: redemption discounted at the annual yield
+    years = (redemption - as_of_day).astype("timedelta64[D]").astype(float) / 365
+    bullet_dirty = np.where(np.nan_to_num(coupon) == 0, face_value / (1 + offer_yield) ** years, np.nan)
+
+    dirty = np.where(periodic, periodic_dirty, bullet_dirty)
+    dirty = np.where(redemption > as_of_day, dirty, np.nan)
+
+    return pd.DataFrame({
+        "Day Count": conventions,
+        "Previous Coupon Date": pd.to_datetime(previous),
+        "Next Coupon Date": pd.to_datetime(next_),
+        "Accrued Interest": accrued,
+        "Dirty Price": dirty,
+        "Clean Price": dirty - accrued,
+        "Settlement Amount": dirty * df["Total Qty"].to_numpy(dtype=float),
+    }, index=df.index)
@@ -0,0 +1,171 @@
+import argparse
+import logging
+import os
+import re
+from concurrent.futures import as_completed
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bond_data import COLUMNS, clean_coupon, read_bond_file
+from process_pool import create_process_pool
+
+logger = logging.getLogger(__name__)
+
+BOND_FILE_EXTENSIONS = (".xlsx", ".json")
+
+NUMERIC_COLUMNS = ["Face Value", "Total Qty", "Total Qty FV", "Offer Yield"]
+
+ISIN_PATTERN = re.compile(r"^IN[A-Z0-9]{10}$")
+
+
+def list_bond_files(directory):
+    """Bond files in ``directory``, oldest first; later files take precedence."""
+    paths = [
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(BOND_FILE_EXTENSIONS) and not name.startswith(("~$", "."))
+    ]
+    return sorted(paths, key=lambda path: (os.stat(path).st_mtime_ns, os.path.basename(path)))
+
+
+def directory_signature(directory):
+    """Changes whenever a bond file in ``directory`` is added, removed or modified."""
+    parts = []
+    for path in list_bond_files(directory):
+        stat = os.stat(path)
+        parts.append(f"{os.path.basename(path)}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
+
+
+def parse_dates(values):
+    # ISO dates first, then day-first strings such as 30-04-2026
+    dates = pd.to_datetime(values, errors="coerce", format="ISO8601")
+    unparsed = dates.isna() & values.notna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(values[unparsed], errors="coerce", format="mixed", dayfirst=True)
+    return dates
+
+
+def validate_bonds(raw, source):
+    """Coerce a raw bond file to the ``COLUMNS`` schema.
+
+    Raises ValueError if columns are missing. Rows with an invalid ISIN,
+    redemption date or numeric field are dropped and reported as issues.
+    """
+    missing = [column for column in COLUMNS if column not in raw.columns]
+    if missing:
+        raise ValueError(f"missing columns {missing}")
+
+    df = raw[COLUMNS].copy()
+    df["ISIN"] = df["ISIN"].astype(str).str.strip().str.upper()
+    df["Coupon"] = df["Coupon"].map(clean_coupon).astype(float)
+    df["Redemption Date"] = parse_dates(df["Redemption Date"])
+    df["Call/Put Date"] = df["Call/Put Date"].astype(str)
+    for column in NUMERIC_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+
+    checks = {
+        "invalid ISIN": ~df["ISIN"].str.match(ISIN_PATTERN),
+        "invalid Redemption Date": df["Redemption Date"].isna(),
+    }
+    for column in NUMERIC_COLUMNS:
+        checks[f"non-numeric {column}"] = df[column].isna()
+
+    issues = []
+    invalid = pd.Series(False, index=df.index)
+    for reason, mask in checks.items():
+        if mask.any():
+            issues.append(f"{source}: {int(mask.sum())} rows with {reason}")
+            invalid |= mask
+    return df[~invalid].reset_index(drop=True), issues
+
+
+def parse_bond_file(path):
+    # Runs in a worker process; openpyxl parsing is pure Python and holds the GIL
+    return validate_bonds(read_bond_file(path), os.path.basename(path))
+
+
+def ingest_files(paths, max_workers=None, strict=False):
+    """Parse and validate ``paths`` in parallel and dedupe on ISIN.
+
+    When an ISIN appears more than once, the row from the later path in
+    ``paths`` wins, and within one file the last row wins.
+    """
+    if not paths:
+        raise ValueError("No bond files to ingest")
+
+    frames = [None] * len(paths)
+    issues = []
+
+    def collect(position, parse):
+        try:
+            frame, file_issues = parse()
+        except Exception as exc:
+            if strict:
+                raise
+            issues.append(f"{os.path.basename(paths[position])}: skipped ({exc})")
+            return
+        frames[position] = frame
+        issues.extend(file_issues)
+
+    if len(paths) == 1 or max_workers == 1:
+        for position, path in enumerate(paths):
+            collect(position, lambda path=path: parse_bond_file(path))
+    else:
+        with create_process_pool(min(max_workers or os.cpu_count(), len(paths))) as executor:
+            futures = {executor.submit(parse_bond_file, path): position for position, path in enumerate(paths)}
+            for future in as_completed(futures):
+                collect(futures[future], future.result)
+
+    if strict and issues:
+        raise ValueError("; ".join(issues))
+    for issue in issues:
+        logger.warning(issue)
+
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        raise ValueError("No valid bond files to ingest")
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined.drop_duplicates(subset="ISIN", keep="last").reset_index(drop=True)
+    logger.info("Ingested %d bonds from %d files", len(combined), len(frames))
+    return combined
+
+
+def ingest_directory(directory, max_workers=None, strict=False):
+    return ingest_files(list_bond_files(directory), max_workers=max_workers, strict=strict)
+
+
+def ingest_path(path, max_workers=None, strict=False):
+    """Ingest a single bond file or a directory of them."""
+    if os.path.isdir(path):
+        return ingest_directory(path, max_workers=max_workers, strict=strict)
+    return ingest_files([path], max_workers=max_workers, strict=strict)
+
+
+def write_store(df, path, row_group_size=50_000):
+    """Write bonds to a Parquet store, replacing it atomically."""
+    table = pa.Table.from_pandas(df[COLUMNS], preserve_index=False)
+    tmp_path = f"{path}.tmp"
+    with pq.ParquetWriter(tmp_path, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=row_group_size):
+            writer.write_batch(batch)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest a directory of bond files into a Parquet store")
+    parser.add_argument("directory", help="directory of XLSX/JSON bond files")
+    parser.add_argument("store", help="output .parquet path; point BONDS_DATA_PATH at it")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--strict", action="store_true", help="fail on any invalid file or row")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    bonds = ingest_directory(args.directory, max_workers=args.workers, strict=args.strict)
+    write_store(bonds, args.store)
+    logger.info("Wrote %s", args.store)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+_main_lock = threading.Lock()
+
+
+def _ready():
+    return os.getpid()
+
+
+def create_process_pool(max_workers=None):
+    """Start a spawn-based process pool that is safe to use from a Streamlit script.
+
+    Streamlit installs the running script as ``sys.modules["__main__"]``, and
+    spawned workers re-import ``__main__``, which would re-run the whole
+    dashboard in every worker. All workers are therefore started up front
+    while a bare ``__main__`` module is in place.
+    """
+    max_workers = max_workers or os.cpu_count()
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    with _main_lock:
+        main_module = sys.modules["__main__"]
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            # One pending task per worker forces every worker to be spawned now
+            futures = [executor.submit(_ready) for _ in range(max_workers)]
+        finally:
+            sys.modules["__main__"] = main_module
+    for future in futures:
+        future.result()
+    return executor
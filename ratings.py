@@ -0,0 +1,36 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Normalized rating scale, best to worst
+RATING_SCALE = [
+    "SOV", "AAA", "AA+", "AA", "AA-", "A+", "A", "A-",
+    "BBB+", "BBB", "BBB-", "BB+", "BB", "BB-", "B+", "B", "B-", "C", "D",
+]
+
+_AGENCY_PREFIX = re.compile(r"^(CRISIL|ICRA|CARE|IND|ACUITE|BWR|INFOMERICS)\s+", re.IGNORECASE)
+_QUALIFIERS = re.compile(r"\(.*?\)|PP-MLD|\bSO\b|\bCE\b", re.IGNORECASE)
+
+
+def normalize_rating(rating):
+    text = str(rating).strip()
+    if text.lower() == "sovereign":
+        return "SOV"
+    text = _AGENCY_PREFIX.sub("", text)
+    text = _QUALIFIERS.sub("", text).replace(" ", "").upper()
+    return text if text in RATING_SCALE else "NR"
+
+
+def normalize_ratings(ratings):
+    """Map agency ratings such as "CRISIL AA+ (CE)" onto ``RATING_SCALE``.
+
+    Returns an ordered categorical; unrecognised ratings become "NR".
+    """
+    codes, uniques = pd.factorize(ratings)
+    mapped = np.array([normalize_rating(value) for value in uniques] + ["NR"], dtype=object)
+    return pd.Categorical(
+        mapped[codes],  # code -1 (missing) picks up the trailing "NR"
+        categories=RATING_SCALE + ["NR"],
+        ordered=True,
+    )
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from ratings import normalize_ratings
+
+# Maturity bands used to group peers
+MATURITY_BINS = [-np.inf, 1, 3, 5, 10, np.inf]
+MATURITY_LABELS = ["<1Y", "1-3Y", "3-5Y", "5-10Y", "10Y+"]
+
+# Peer groups smaller than this get no score
+MIN_PEERS = 3
+
+# Z-score beyond which a bond is flagged cheap (positive) or rich (negative)
+SIGNAL_THRESHOLD = 1.0
+
+RV_COLUMNS = [
+    "Rating Bucket", "Maturity Band", "Peer Count", "Peer Median Yield",
+    "Spread to Peers (bp)", "Peer Z-Score", "Peer Percentile", "RV Signal",
+]
+
+
+def peer_relative_value(df, yields=None):
+    """Compare each bond's yield with peers in its rating bucket and maturity band.
+
+    ``yields`` defaults to ``Offer Yield``; pass pre-tax equivalent yields so
+    tax-free issues are compared with taxable peers on the same basis.
+    Returns a frame aligned with ``df`` holding the ``RV_COLUMNS``.
+    """
+    rating_bucket = normalize_ratings(df["Credit Rating"])
+    maturity_band = pd.cut(
+        df["Years to Maturity"].to_numpy(dtype=float),
+        bins=MATURITY_BINS,
+        labels=MATURITY_LABELS,
+    )
+
+    # One integer code per (rating bucket, maturity band) pair
+    n_bands = len(MATURITY_LABELS)
+    group_codes = rating_bucket.codes.astype(np.int64) * n_bands + maturity_band.codes
+    group_codes = np.where(maturity_band.codes < 0, -1, group_codes)
+
+    if yields is None:
+        yields = df["Offer Yield"]
+    yields = pd.Series(np.asarray(yields, dtype=float), index=df.index)
+    grouped = yields.groupby(group_codes)
+    peer_count = grouped.transform("count")
+    peer_median = grouped.transform("median")
+    peer_mean = grouped.transform("mean")
+    peer_std = grouped.transform("std")
+    percentile = grouped.rank(pct=True)
+
+    z_score = ((yields - peer_mean) / peer_std).where(peer_std > 0, 0.0)
+    too_few = (peer_count < MIN_PEERS) | (group_codes < 0)
+    z_score[too_few] = np.nan
+    percentile[too_few] = np.nan
+
+    signal = np.select(
+        [z_score >= SIGNAL_THRESHOLD, z_score <= -SIGNAL_THRESHOLD],
+        ["Cheap", "Rich"],
+        default="Fair",
+    )
+    signal = np.where(z_score.isna(), "-", signal)
+
+    return pd.DataFrame({
+        "Rating Bucket": rating_bucket.astype(str),
+        "Maturity Band": maturity_band.astype(str),
+        "Peer Count": peer_count.fillna(0).astype(int),
+        "Peer Median Yield": peer_median,
+        "Spread to Peers (bp)": (yields - peer_median) * 1e4,
+        "Peer Z-Score": z_score,
+        "Peer Percentile": percentile,
+        "RV Signal": signal,
+    }, index=df.index)
@@ -0,0 +1,100 @@
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+# Columns covered by the search box and their ranking weights
+SEARCH_FIELDS = {
+    "ISIN": 1.0,
+    "Issuer Name": 1.0,
+    "Special Feature": 0.6,
+    "Principal Redemption": 0.4,
+}
+
+# Share of query trigrams a value must contain to count as a match
+MIN_MATCH_SCORE = 0.5
+
+_NON_ALNUM = re.compile(r"[^a-z0-9%]+")
+
+
+def normalize_text(value):
+    return _NON_ALNUM.sub(" ", str(value).lower()).strip()
+
+
+def trigrams(text):
+    # Pad each word so short tokens and word starts still produce trigrams
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """Trigram index over the bond inventory.
+
+    Each field is factorized so the postings are built over its unique values
+    only; a query scores the unique values and gathers the scores back onto
+    rows through the factor codes.
+    """
+
+    def __init__(self, df, fields=SEARCH_FIELDS):
+        self.n_rows = len(df)
+        self.fields = []
+        for column, weight in fields.items():
+            codes, uniques = pd.factorize(df[column].astype(str))
+            normalized = [normalize_text(value) for value in uniques]
+
+            postings = defaultdict(list)
+            for value_id, text in enumerate(normalized):
+                for gram in trigrams(text):
+                    postings[gram].append(value_id)
+            postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+            # Sorted unique values for exact prefix lookups (ISIN, issuer)
+            order = np.argsort(normalized, kind="stable")
+            sorted_values = np.asarray(normalized, dtype=object)[order]
+
+            self.fields.append({
+                "column": column,
+                "weight": weight,
+                "codes": codes.astype(np.int32),
+                "n_values": len(uniques),
+                "postings": postings,
+                "sorted_values": sorted_values,
+                "sorted_ids": order.astype(np.int32),
+            })
+
+    def _prefix_ids(self, field, prefix):
+        values = field["sorted_values"]
+        lo = np.searchsorted(values, prefix, side="left")
+        hi = np.searchsorted(values, prefix + "\uffff", side="left")
+        return field["sorted_ids"][lo:hi]
+
+    def scores(self, query):
+        """Return a per-row relevance score in [0, 1] for ``query``."""
+        text = normalize_text(query)
+        grams = trigrams(text)
+        row_scores = np.zeros(self.n_rows, dtype=np.float32)
+        if not grams:
+            return row_scores
+
+        for field in self.fields:
+            hits = [field["postings"][gram] for gram in grams if gram in field["postings"]]
+            value_scores = np.zeros(field["n_values"], dtype=np.float32)
+            if hits:
+                counts = np.bincount(np.concatenate(hits), minlength=field["n_values"])
+                value_scores = (counts / len(grams)).astype(np.float32)
+            value_scores[self._prefix_ids(field, text)] = 1.0
+            value_scores[value_scores < MIN_MATCH_SCORE] = 0.0
+            np.maximum(row_scores, value_scores[field["codes"]] * field["weight"], out=row_scores)
+
+        return row_scores
+
+    def search(self, query, limit=None):
+        """Return matching row positions ranked by relevance."""
+        row_scores = self.scores(query)
+        matches = np.flatnonzero(row_scores > 0)
+        ranked = matches[np.argsort(-row_scores[matches], kind="stable")]
+        return ranked if limit is None else ranked[:limit]
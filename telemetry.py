@@ -0,0 +1,197 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger("bond_telemetry")
+
+# Samples kept per section for the rolling percentiles
+WINDOW_SIZE = 500
+
+# Set to a port number to serve Prometheus-style metrics on /metrics
+METRICS_PORT_ENV = "BONDS_METRICS_PORT"
+
+# Interface the metrics server listens on; set to 0.0.0.0 to expose it
+METRICS_HOST_ENV = "BONDS_METRICS_HOST"
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+
+def payload_size(obj):
+    """Approximate serialized size in bytes of what a section sends to the browser."""
+    if obj is None:
+        return None
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    if hasattr(obj, "to_plotly_json"):
+        return len(obj.to_json())
+    if hasattr(obj, "data") and isinstance(obj.data, pd.DataFrame):
+        obj = obj.data  # pandas Styler
+    if isinstance(obj, pd.DataFrame):
+        try:
+            return pa.Table.from_pandas(obj, preserve_index=False).nbytes
+        except Exception:
+            return int(obj.memory_usage(deep=True).sum())
+    return len(str(obj).encode("utf-8"))
+
+
+class SectionRecord:
+    def __init__(self, name):
+        self.name = name
+        self.rows = None
+        self.payload_bytes = None
+        self.duration_ms = None
+
+
+class Telemetry:
+    """Per-section timings, row counts and payload sizes over a rolling window.
+
+    Shared by all sessions; each rerun's sections are also written to the
+    ``bond_telemetry`` logger as one JSON line.
+    """
+
+    def __init__(self, window_size=WINDOW_SIZE):
+        self._samples = defaultdict(lambda: deque(maxlen=window_size))
+        self._totals = defaultdict(lambda: [0, 0.0])
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start_rerun(self, measure_payloads=False):
+        self._local.records = []
+        self._local.measure_payloads = measure_payloads
+        self._local.started = time.perf_counter()
+
+    @property
+    def measure_payloads(self):
+        return getattr(self._local, "measure_payloads", False)
+
+    @contextmanager
+    def section(self, name):
+        record = SectionRecord(name)
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration_ms = (time.perf_counter() - started) * 1000
+            self._add(record)
+
+    def measure(self, record, obj):
+        """Attach the payload size of ``obj`` to ``record`` when enabled."""
+        if self.measure_payloads:
+            record.payload_bytes = payload_size(obj)
+        return obj
+
+    def finish_rerun(self):
+        record = SectionRecord("rerun")
+        record.duration_ms = (time.perf_counter() - self._local.started) * 1000
+        self._add(record)
+        logger.info(json.dumps({
+            "event": "rerun",
+            "sections": [
+                {"section": r.name, "ms": round(r.duration_ms, 2), "rows": r.rows, "bytes": r.payload_bytes}
+                for r in self._local.records
+            ],
+        }))
+
+    def _add(self, record):
+        with self._lock:
+            self._samples[record.name].append(
+                (record.duration_ms, record.rows, record.payload_bytes)
+            )
+            totals = self._totals[record.name]
+            totals[0] += 1
+            totals[1] += record.duration_ms / 1000
+        records = getattr(self._local, "records", None)
+        if records is not None:
+            records.append(record)
+
+    def summary(self):
+        """One row per section with p50/p95 latency and the latest rows and payload."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        rows = []
+        for name, values in samples.items():
+            durations = np.array([value[0] for value in values])
+            rows.append({
+                "Section": name,
+                "Samples": len(values),
+                "p50 (ms)": np.percentile(durations, 50),
+                "p95 (ms)": np.percentile(durations, 95),
+                "Last Rows": values[-1][1],
+                "Last Payload (KB)": values[-1][2] / 1024 if values[-1][2] is not None else None,
+            })
+        return pd.DataFrame(rows, columns=[
+            "Section", "Samples", "p50 (ms)", "p95 (ms)", "Last Rows", "Last Payload (KB)",
+        ])
+
+    def prometheus_text(self):
+        lines = [
+            "# HELP bonds_section_duration_seconds Dashboard section render time over the rolling window.",
+            "# TYPE bonds_section_duration_seconds summary",
+        ]
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+            totals = {name: list(values) for name, values in self._totals.items()}
+        for name, values in sorted(samples.items()):
+            durations = np.array([value[0] for value in values]) / 1000
+            for quantile in (0.5, 0.95):
+                lines.append(
+                    f'bonds_section_duration_seconds{{section="{name}",quantile="{quantile}"}} '
+                    f"{np.quantile(durations, quantile):.6f}"
+                )
+            count, total = totals[name]
+            lines.append(f'bonds_section_duration_seconds_sum{{section="{name}"}} {total:.6f}')
+            lines.append(f'bonds_section_duration_seconds_count{{section="{name}"}} {count}')
+        lines.append("# TYPE bonds_section_rows gauge")
+        for name, values in sorted(samples.items()):
+            if values[-1][1] is not None:
+                lines.append(f'bonds_section_rows{{section="{name}"}} {values[-1][1]}')
+        lines.append("# TYPE bonds_section_payload_bytes gauge")
+        for name, values in sorted(samples.items()):
+            if values[-1][2] is not None:
+                lines.append(f'bonds_section_payload_bytes{{section="{name}"}} {values[-1][2]}')
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(telemetry, port, host=None):
+    """Serve ``telemetry`` in Prometheus text format on http://<host>:<port>/metrics.
+
+    Returns None if the port is taken, e.g. by another dashboard worker on
+    the same host, so only the first worker exports metrics.
+    """
+    host = host or os.environ.get(METRICS_HOST_ENV, DEFAULT_METRICS_HOST)
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = telemetry.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+    except OSError as exc:
+        logger.warning("Metrics server not started on %s:%d: %s", host, port, exc)
+        return None
+    threading.Thread(target=server.serve_forever, name="bond-metrics", daemon=True).start()
+    return server
+
+
+def metrics_port():
+    port = os.environ.get(METRICS_PORT_ENV)
+    return int(port) if port else None